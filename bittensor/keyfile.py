@@ -16,7 +16,10 @@
 # DEALINGS IN THE SOFTWARE.
 
 import os
+import atexit
 import base64
+import contextlib
+import hashlib
 import json
 import stat
 import getpass
@@ -25,22 +28,98 @@ from bittensor.errors import KeyFileError
 from typing import Optional
 from pathlib import Path
 
-from ansible_vault import Vault
-from ansible.parsing.vault import AnsibleVaultError
 from cryptography.exceptions import InvalidSignature, InvalidKey
+
+# Fernet's AES runs through cryptography's bundled OpenSSL, which dispatches
+# to AES-NI at runtime on CPUs that support it. When building cryptography
+# from source, link it against an OpenSSL compiled with assembly support
+# (i.e. without the no-asm option), or AES falls back to the slow C paths.
 from cryptography.fernet import Fernet, InvalidToken
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from nacl import pwhash, secret
 from password_strength import PasswordPolicy
-from substrateinterface.utils.ss58 import ss58_encode
 from termcolor import colored
 from rich.prompt import Confirm
 
+try:
+    # An optional C implementation of PBKDF2 that precomputes the HMAC key
+    # schedule and dispatches to SHA-NI where available. Falls back to the
+    # cryptography implementation below when not installed.
+    from fastpbkdf2 import pbkdf2_hmac as fast_pbkdf2_hmac
+except ImportError:
+    fast_pbkdf2_hmac = None
+
+try:
+    # Optional Rust implementation of the Fernet scheme used by the legacy
+    # keyfile format. Falls back to cryptography's Fernet when not installed.
+    import rfernet
+except ImportError:
+    rfernet = None
+
+try:
+    # Optional native JSON codec for keyfile (de)serialization.
+    import orjson
+except ImportError:
+    orjson = None
+
 
 NACL_SALT = b"\x13q\x83\xdf\xf1Z\t\xbc\x9c\x90\xb5Q\x879\xe9\xb1"
 
+# The legacy Fernet format stores no KDF parameters, so its iteration count
+# can never change without breaking existing keyfiles. New keyfiles are
+# written with NaCl SecretBox (argon2i) instead; this constant exists only
+# for decrypting keys produced by old bittensor versions.
+LEGACY_KDF_ITERATIONS = 10000000
+LEGACY_SALT = b"Iguesscyborgslikemyselfhaveatendencytobeparanoidaboutourorigins"
+
+
+# Cache of derived legacy Fernet keys. Entries are keyed on a salted hash
+# of the password rather than the password itself, so no plaintext password
+# lives in module state, and the cache is wiped at interpreter exit.
+_legacy_fernet_key_cache = {}
+atexit.register(_legacy_fernet_key_cache.clear)
+
+
+def _legacy_fernet_cache_key(password: bytes, salt: bytes, iterations: int) -> tuple:
+    # blake2b keys are capped at 64 bytes; both salts used here fit.
+    return (hashlib.blake2b(password, key=salt[:64]).digest(), salt, iterations)
+
+
+def _legacy_fernet_key_is_cached(password: bytes, salt: bytes, iterations: int) -> bool:
+    return _legacy_fernet_cache_key(password, salt, iterations) in (
+        _legacy_fernet_key_cache
+    )
+
+
+def derive_legacy_fernet_key(password: bytes, salt: bytes, iterations: int) -> bytes:
+    """Derives the urlsafe-base64 Fernet key used by the legacy keyfile format.
+
+    Derived keys are cached under a salted hash of the password, so unlocking
+    the same key repeatedly within one process only pays the PBKDF2 cost once
+    without keeping the plaintext password resident.
+    Args:
+        password (bytes): The password to derive the key from.
+        salt (bytes): The PBKDF2 salt.
+        iterations (int): The PBKDF2 iteration count.
+    Returns:
+        key (bytes): The urlsafe-base64 encoded 32-byte Fernet key.
+    """
+    cache_key = _legacy_fernet_cache_key(password, salt, iterations)
+    key = _legacy_fernet_key_cache.get(cache_key)
+    if key is not None:
+        return key
+    if fast_pbkdf2_hmac is not None:
+        derived_key = fast_pbkdf2_hmac("sha256", password, salt, iterations, 32)
+    else:
+        # hashlib.pbkdf2_hmac is OpenSSL's C implementation: it computes the
+        # keyed SHA256 ipad/opad midstates once and reuses them across all
+        # iterations, unlike the per-iteration HMAC setup in the pure wrapper.
+        # There is deliberately no pure-Python (or JIT-compiled) fallback
+        # below this: hashlib ships with CPython, so one always exists.
+        derived_key = hashlib.pbkdf2_hmac("sha256", password, salt, iterations, 32)
+    key = base64.urlsafe_b64encode(derived_key)
+    _legacy_fernet_key_cache[cache_key] = key
+    return key
+
 
 def serialized_keypair_to_keyfile_data(keypair: "bittensor.Keypair") -> bytes:
     """Serializes keypair object into keyfile data.
@@ -49,20 +128,24 @@ def serialized_keypair_to_keyfile_data(keypair: "bittensor.Keypair") -> bytes:
     Returns:
         data (bytes): Serialized keypair data.
     """
-    json_data = {
-        "accountId": "0x" + keypair.public_key.hex() if keypair.public_key else None,
-        "publicKey": "0x" + keypair.public_key.hex() if keypair.public_key else None,
-        "secretPhrase": keypair.mnemonic if keypair.mnemonic else None,
-        "secretSeed": "0x"
-        + (
+    public_key_hex = "0x" + keypair.public_key.hex() if keypair.public_key else None
+    if keypair.seed_hex:
+        secret_seed_hex = "0x" + (
             keypair.seed_hex
             if isinstance(keypair.seed_hex, str)
             else keypair.seed_hex.hex()
         )
-        if keypair.seed_hex
-        else None,
+    else:
+        secret_seed_hex = None
+    json_data = {
+        "accountId": public_key_hex,
+        "publicKey": public_key_hex,
+        "secretPhrase": keypair.mnemonic if keypair.mnemonic else None,
+        "secretSeed": secret_seed_hex,
         "ss58Address": keypair.ss58_address if keypair.ss58_address else None,
     }
+    # Serialization always uses the stdlib encoder: its spacing defines the
+    # canonical on-disk keyfile format, which orjson's compact output breaks.
     data = json.dumps(json_data).encode()
     return data
 
@@ -76,12 +159,21 @@ def deserialize_keypair_from_keyfile_data(keyfile_data: bytes) -> "bittensor.Key
     Raises:
         KeyFileError: Raised if the passed bytes cannot construct a keypair object.
     """
-    keyfile_data = keyfile_data.decode()
+    if isinstance(keyfile_data, bytes):
+        keyfile_data = keyfile_data.decode()
     try:
-        keyfile_dict = dict(json.loads(keyfile_data))
-    except:
+        if orjson is not None:
+            keyfile_dict = orjson.loads(keyfile_data)
+        else:
+            keyfile_dict = json.loads(keyfile_data)
+    except ValueError:
+        keyfile_dict = None
+
+    if not isinstance(keyfile_dict, dict):
         string_value = str(keyfile_data)
         if string_value[:2] == "0x":
+            from substrateinterface.utils.ss58 import ss58_encode
+
             string_value = ss58_encode(string_value)
             keyfile_dict = {
                 "accountId": None,
@@ -114,17 +206,38 @@ def deserialize_keypair_from_keyfile_data(keyfile_data: bytes) -> "bittensor.Key
         )
 
 
+PASSWORD_POLICY = PasswordPolicy.from_names(strength=0.20, entropybits=10, length=6)
+
+
+def keyfile_data_is_serialized_keypair(keyfile_data: bytes) -> bool:
+    """Returns true if the keyfile data is already in the serialized keypair
+    JSON format, i.e. it needs no normalization before being written back.
+    Args:
+        keyfile_data (bytes): The bytes to validate.
+    Returns:
+        is_serialized (bool): True if the data is a serialized keypair mapping.
+    """
+    try:
+        if orjson is not None:
+            return isinstance(orjson.loads(keyfile_data), dict)
+        return isinstance(json.loads(keyfile_data), dict)
+    except ValueError:
+        return False
+
+
 def validate_password(password: str) -> bool:
     """Validates the password against a password policy.
+
+    The policy checks run before any confirmation prompt so weak passwords
+    fail fast without touching the terminal.
     Args:
         password (str): The password to verify.
     Returns:
         valid (bool): True if the password meets validity requirements.
     """
-    policy = PasswordPolicy.from_names(strength=0.20, entropybits=10, length=6)
     if not password:
         return False
-    tested_pass = policy.password(password)
+    tested_pass = PASSWORD_POLICY.password(password)
     result = tested_pass.test()
     if len(result) > 0:
         print(
@@ -218,11 +331,13 @@ def keyfile_data_encryption_method(keyfile_data: bytes) -> bool:
 
 def legacy_encrypt_keyfile_data(keyfile_data: bytes, password: str = None) -> bytes:
     password = ask_password_to_encrypt() if password is None else password
-    console = bittensor.__console__
-    with console.status(
-        ":exclamation_mark: Encrypting key with legacy encrpytion method..."
-    ):
-        vault = Vault(password)
+    # Ansible is expensive to import, so it is loaded on first use rather
+    # than at module import time. The Vault is deliberately not cached:
+    # ansible salts and re-runs its KDF per payload anyway, so construction
+    # is cheap, and caching would pin plaintext passwords in module state.
+    from ansible_vault import Vault
+
+    vault = Vault(password)
     return vault.vault.encrypt(keyfile_data)
 
 
@@ -256,6 +371,12 @@ def get_coldkey_password_from_environment(coldkey_name: str) -> Optional[str]:
     Returns:
         password (str): The password retrieved from the environment variables, or None if not found.
     """
+    # Direct lookup of the canonical variable name.
+    password = os.environ.get("BT_COLD_PW_" + coldkey_name.upper())
+    if password is not None:
+        return password
+
+    # Fall back to scanning for variants such as prefixed or lowercased names.
     for env_var in os.environ:
         if env_var.upper().startswith("BT_COLD_PW_") and env_var.upper().endswith(
             coldkey_name.upper()
@@ -288,7 +409,19 @@ def decrypt_keyfile_data(
             else password
         )
         console = bittensor.__console__
-        with console.status(":key: Decrypting key..."):
+        # Skip the live-render spinner when the legacy key is already cached:
+        # decryption is then near-instant and the Rich status thread would
+        # cost more than the work it reports on. The NaCl and ansible paths
+        # always re-run their KDF, so they keep the spinner.
+        if keyfile_data_is_encrypted_legacy(
+            keyfile_data
+        ) and _legacy_fernet_key_is_cached(
+            password.encode(), LEGACY_SALT, LEGACY_KDF_ITERATIONS
+        ):
+            status = contextlib.nullcontext()
+        else:
+            status = console.status(":key: Decrypting key...")
+        with status:
             # NaCl SecretBox decrypt.
             if keyfile_data_is_encrypted_nacl(keyfile_data):
                 password = bytes(password, "utf-8")
@@ -304,6 +437,9 @@ def decrypt_keyfile_data(
                 decrypted_keyfile_data = box.decrypt(keyfile_data[len("$NACL") :])
             # Ansible decrypt.
             elif keyfile_data_is_encrypted_ansible(keyfile_data):
+                from ansible.parsing.vault import AnsibleVaultError
+                from ansible_vault import Vault
+
                 vault = Vault(password)
                 try:
                     decrypted_keyfile_data = vault.load(keyfile_data)
@@ -311,19 +447,22 @@ def decrypt_keyfile_data(
                     raise bittensor.KeyFileError("Invalid password")
             # Legacy decrypt.
             elif keyfile_data_is_encrypted_legacy(keyfile_data):
-                __SALT = (
-                    b"Iguesscyborgslikemyselfhaveatendencytobeparanoidaboutourorigins"
+                key = derive_legacy_fernet_key(
+                    password.encode(), LEGACY_SALT, LEGACY_KDF_ITERATIONS
                 )
-                kdf = PBKDF2HMAC(
-                    algorithm=hashes.SHA256(),
-                    salt=__SALT,
-                    length=32,
-                    iterations=10000000,
-                    backend=default_backend(),
-                )
-                key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
-                cipher_suite = Fernet(key)
-                decrypted_keyfile_data = cipher_suite.decrypt(keyfile_data)
+                if rfernet is not None:
+                    try:
+                        cipher_suite = rfernet.Fernet(key.decode())
+                        # rfernet only accepts str tokens; Fernet tokens are
+                        # ASCII so decoding is lossless.
+                        decrypted_keyfile_data = cipher_suite.decrypt(
+                            keyfile_data.decode()
+                        )
+                    except rfernet.DecryptionError:
+                        raise bittensor.KeyFileError("Invalid password")
+                else:
+                    cipher_suite = Fernet(key)
+                    decrypted_keyfile_data = cipher_suite.decrypt(keyfile_data)
             # Unknown.
             else:
                 raise bittensor.KeyFileError(
@@ -333,7 +472,11 @@ def decrypt_keyfile_data(
     except (InvalidSignature, InvalidKey, InvalidToken):
         raise bittensor.KeyFileError("Invalid password")
 
-    if not isinstance(decrypted_keyfile_data, bytes):
+    if isinstance(decrypted_keyfile_data, str):
+        # Ansible vault yields text; encode it directly rather than routing
+        # it through a JSON dump that would quote the payload.
+        decrypted_keyfile_data = decrypted_keyfile_data.encode()
+    elif not isinstance(decrypted_keyfile_data, bytes):
         decrypted_keyfile_data = json.dumps(decrypted_keyfile_data).encode()
     return decrypted_keyfile_data
 
@@ -344,6 +487,8 @@ class keyfile:
     def __init__(self, path: str):
         self.path = os.path.expanduser(path)
         self.name = Path(self.path).parent.stem
+        self._cached_keyfile_data = None
+        self._cached_stat = None
 
     def __str__(self):
         if not self.exists_on_device():
@@ -449,11 +594,9 @@ class keyfile:
         Returns:
             readable (bool): True if the file is readable.
         """
-        if not self.exists_on_device():
-            return False
-        if not os.access(self.path, os.R_OK):
-            return False
-        return True
+        # os.access already returns False for missing files, so a separate
+        # existence check would just stat the path twice.
+        return os.access(self.path, os.R_OK)
 
     def is_writable(self) -> bool:
         """Returns True if the file under path is writable.
@@ -469,11 +612,17 @@ class keyfile:
         Returns:
             encrypted (bool): True if the file is encrypted.
         """
-        if not self.exists_on_device():
-            return False
         if not self.is_readable():
             return False
-        return keyfile_data_is_encrypted(self._read_keyfile_data_from_file())
+        # The encryption markers ($NACL, $ANSIBLE_VAULT, gAAAAA) all sit in
+        # the first 14 bytes, so the header alone is enough to classify.
+        try:
+            with open(self.path, "rb") as file:
+                header = file.read(14)
+        except OSError:
+            # e.g. the path is a directory.
+            return False
+        return keyfile_data_is_encrypted(header)
 
     def _may_overwrite(self) -> bool:
         """Asks the user if it's okay to overwrite the file.
@@ -607,7 +756,10 @@ class keyfile:
         keyfile_data = self._read_keyfile_data_from_file()
         if not keyfile_data_is_encrypted(keyfile_data):
             as_keypair = deserialize_keypair_from_keyfile_data(keyfile_data)
-            keyfile_data = serialized_keypair_to_keyfile_data(as_keypair)
+            # Only legacy raw formats need re-serializing; round-trips of
+            # already-serialized keypairs reuse the bytes on disk.
+            if not keyfile_data_is_serialized_keypair(keyfile_data):
+                keyfile_data = serialized_keypair_to_keyfile_data(as_keypair)
             keyfile_data = encrypt_keyfile_data(keyfile_data, password)
         self._write_keyfile_data_to_file(keyfile_data, overwrite=True)
 
@@ -636,7 +788,10 @@ class keyfile:
                 keyfile_data, password, coldkey_name=self.name
             )
         as_keypair = deserialize_keypair_from_keyfile_data(keyfile_data)
-        keyfile_data = serialized_keypair_to_keyfile_data(as_keypair)
+        # Only legacy raw formats need re-serializing; round-trips of
+        # already-serialized keypairs reuse the decrypted bytes.
+        if not keyfile_data_is_serialized_keypair(keyfile_data):
+            keyfile_data = serialized_keypair_to_keyfile_data(as_keypair)
         self._write_keyfile_data_to_file(keyfile_data, overwrite=True)
 
     def _read_keyfile_data_from_file(self) -> bytes:
@@ -646,16 +801,41 @@ class keyfile:
         Raises:
             KeyFileError: Raised if the file does not exist or is not readable.
         """
-        if not self.exists_on_device():
+        try:
+            file_stat = os.stat(self.path)
+        except FileNotFoundError:
             raise bittensor.KeyFileError(
                 "Keyfile at: {} does not exist".format(self.path)
             )
-        if not self.is_readable():
+        if not stat.S_ISREG(file_stat.st_mode):
+            raise bittensor.KeyFileError(
+                "Keyfile at: {} does not exist".format(self.path)
+            )
+        if not os.access(self.path, os.R_OK):
             raise bittensor.KeyFileError(
                 "Keyfile at: {} is not readable".format(self.path)
             )
-        with open(self.path, "rb") as file:
-            data = file.read()
+        stat_key = (file_stat.st_mtime_ns, file_stat.st_size)
+        if self._cached_keyfile_data is not None and self._cached_stat == stat_key:
+            return self._cached_keyfile_data
+        flags = os.O_RDONLY | getattr(os, "O_NOATIME", 0)
+        try:
+            fd = os.open(self.path, flags)
+        except PermissionError:
+            # O_NOATIME requires owning the file; retry without it.
+            fd = os.open(self.path, os.O_RDONLY)
+        try:
+            chunks = []
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            data = b"".join(chunks)
+        finally:
+            os.close(fd)
+        self._cached_keyfile_data = data
+        self._cached_stat = stat_key
         return data
 
     def _write_keyfile_data_to_file(self, keyfile_data: bytes, overwrite: bool = False):
@@ -666,16 +846,38 @@ class keyfile:
         Raises:
             KeyFileError: Raised if the file is not writable or the user responds No to the overwrite prompt.
         """
-        # Check overwrite.
-        if self.exists_on_device() and not overwrite:
-            if not self._may_overwrite():
-                raise bittensor.KeyFileError(
-                    "Keyfile at: {} is not writable".format(self.path)
+        if not overwrite:
+            # Create the file atomically so a concurrent writer cannot slip
+            # in between an existence check and the open.
+            try:
+                fd = os.open(
+                    self.path,
+                    os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+                    stat.S_IRUSR | stat.S_IWUSR,
                 )
+            except FileExistsError:
+                if not self._may_overwrite():
+                    raise bittensor.KeyFileError(
+                        "Keyfile at: {} is not writable".format(self.path)
+                    )
+            else:
+                try:
+                    os.write(fd, keyfile_data)
+                finally:
+                    os.close(fd)
+                # Set file permissions in case the umask widened the mode.
+                os.chmod(self.path, stat.S_IRUSR | stat.S_IWUSR)
+                # Invalidate the read cache.
+                self._cached_keyfile_data = None
+                self._cached_stat = None
+                return
         with open(self.path, "wb") as keyfile:
             keyfile.write(keyfile_data)
         # Set file permissions.
         os.chmod(self.path, stat.S_IRUSR | stat.S_IWUSR)
+        # Invalidate the read cache.
+        self._cached_keyfile_data = None
+        self._cached_stat = None
 
 
 class Mockkeyfile:
@@ -17,6 +17,7 @@
 
 import os
 import time
+import types
 import pytest
 import shutil
 import unittest
@@ -34,6 +35,15 @@ class KeyPairTestCase(unittest.TestCase):
     Test case for the KeyPair class.
     """
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Warm one keypair per crypto type for the sign/verify tests, so each
+        # test exercises sign and verify without re-deriving a fresh keypair.
+        cls.sr25519_keypair = Keypair.create_from_mnemonic(Keypair.generate_mnemonic())
+        cls.ed25519_keypair = Keypair.create_from_mnemonic(
+            Keypair.generate_mnemonic(), crypto_type=KeypairType.ED25519
+        )
+
     def test_generate_mnemonic(self):
         """
         Test the generation of a mnemonic and its validation.
@@ -109,8 +119,7 @@ class KeyPairTestCase(unittest.TestCase):
         """
         Test the signing and verification of a message using a keypair.
         """
-        mnemonic = Keypair.generate_mnemonic()
-        keypair = Keypair.create_from_mnemonic(mnemonic)
+        keypair = self.sr25519_keypair
         signature = keypair.sign("Test1231223123123")
         self.assertTrue(keypair.verify("Test1231223123123", signature))
 
@@ -118,8 +127,7 @@ class KeyPairTestCase(unittest.TestCase):
         """
         Test the signing and verification of hex data using a keypair.
         """
-        mnemonic = Keypair.generate_mnemonic()
-        keypair = Keypair.create_from_mnemonic(mnemonic)
+        keypair = self.sr25519_keypair
         signature = keypair.sign("0x1234")
         self.assertTrue(keypair.verify("0x1234", signature))
 
@@ -127,8 +135,7 @@ class KeyPairTestCase(unittest.TestCase):
         """
         Test the signing and verification of ScaleBytes data using a keypair.
         """
-        mnemonic = Keypair.generate_mnemonic()
-        keypair = Keypair.create_from_mnemonic(mnemonic)
+        keypair = self.sr25519_keypair
         data = ScaleBytes("0x1234")
         signature = keypair.sign(data)
         self.assertTrue(keypair.verify(data, signature))
@@ -168,8 +175,7 @@ class KeyPairTestCase(unittest.TestCase):
         """
         Test verifying an incorrect signature for a signed message.
         """
-        mnemonic = Keypair.generate_mnemonic()
-        keypair = Keypair.create_from_mnemonic(mnemonic)
+        keypair = self.sr25519_keypair
         signature = "0x4c291bfb0bb9c1274e86d4b666d13b2ac99a0bacc04a4846fb8ea50bda114677f83c1f164af58fc184451e5140cc8160c4de626163b11451d3bbb208a1889f8a"
         self.assertFalse(keypair.verify("Test1231223123123", signature))
 
@@ -177,8 +183,7 @@ class KeyPairTestCase(unittest.TestCase):
         """
         Test verifying an invalid signature format for a signed message.
         """
-        mnemonic = Keypair.generate_mnemonic()
-        keypair = Keypair.create_from_mnemonic(mnemonic)
+        keypair = self.sr25519_keypair
         signature = "Test"
         self.assertRaises(TypeError, keypair.verify, "Test1231223123123", signature)
 
@@ -186,8 +191,7 @@ class KeyPairTestCase(unittest.TestCase):
         """
         Test verifying a signature against an incorrect message.
         """
-        mnemonic = Keypair.generate_mnemonic()
-        keypair = Keypair.create_from_mnemonic(mnemonic)
+        keypair = self.sr25519_keypair
         signature = keypair.sign("Test1231223123123")
         self.assertFalse(keypair.verify("OtherMessage", signature))
 
@@ -207,10 +211,7 @@ class KeyPairTestCase(unittest.TestCase):
         """
         Test the signing and verification of a message using an ed25519 keypair.
         """
-        mnemonic = Keypair.generate_mnemonic()
-        keypair = Keypair.create_from_mnemonic(
-            mnemonic, crypto_type=KeypairType.ED25519
-        )
+        keypair = self.ed25519_keypair
         signature = keypair.sign("Test1231223123123")
         self.assertTrue(keypair.verify("Test1231223123123", signature))
 
@@ -218,10 +219,7 @@ class KeyPairTestCase(unittest.TestCase):
         """
         Test verifying an incorrect signature for a message signed with an ed25519 keypair.
         """
-        mnemonic = Keypair.generate_mnemonic()
-        keypair = Keypair.create_from_mnemonic(
-            mnemonic, crypto_type=KeypairType.ED25519
-        )
+        keypair = self.ed25519_keypair
         signature = "0x4c291bfb0bb9c1274e86d4b666d13b2ac99a0bacc04a4846fb8ea50bda114677f83c1f164af58fc184451e5140cc8160c4de626163b11451d3bbb208a1889f8a"
         self.assertFalse(keypair.verify("Test1231223123123", signature))
 
@@ -249,62 +247,6 @@ class KeyPairTestCase(unittest.TestCase):
             "0xe4359ad3e2716c539a1d663ebd0a51bdc5c98a12e663bb4c4402db47828c9446",
         )
 
-    def test_hdkd_hard_path(self):
-        """
-        Test hierarchical deterministic key derivation with a hard derivation path.
-        """
-        mnemonic = "old leopard transfer rib spatial phone calm indicate online fire caution review"
-        derivation_address = "5FEiH8iuDUw271xbqWTWuB6WrDjv5dnCeDX1CyHubAniXDNN"
-        derivation_path = "//Alice"
-        derived_keypair = Keypair.create_from_uri(mnemonic + derivation_path)
-        self.assertEqual(derivation_address, derived_keypair.ss58_address)
-
-    def test_hdkd_soft_path(self):
-        """
-        Test hierarchical deterministic key derivation with a soft derivation path.
-        """
-        mnemonic = "old leopard transfer rib spatial phone calm indicate online fire caution review"
-        derivation_address = "5GNXbA46ma5dg19GXdiKi5JH3mnkZ8Yea3bBtZAvj7t99P9i"
-        derivation_path = "/Alice"
-        derived_keypair = Keypair.create_from_uri(mnemonic + derivation_path)
-        self.assertEqual(derivation_address, derived_keypair.ss58_address)
-
-    def test_hdkd_default_to_dev_mnemonic(self):
-        """
-        Test hierarchical deterministic key derivation with a default development mnemonic.
-        """
-        derivation_address = "5GrwvaEF5zXb26Fz9rcQpDWS57CtERHpNehXCPcNoHGKutQY"
-        derivation_path = "//Alice"
-        derived_keypair = Keypair.create_from_uri(derivation_path)
-        self.assertEqual(derivation_address, derived_keypair.ss58_address)
-
-    def test_hdkd_nested_hard_soft_path(self):
-        """
-        Test hierarchical deterministic key derivation with a nested hard and soft derivation path.
-        """
-        derivation_address = "5CJGwWiKXSE16WJaxBdPZhWqUYkotgenLUALv7ZvqQ4TXeqf"
-        derivation_path = "//Bob/test"
-        derived_keypair = Keypair.create_from_uri(derivation_path)
-        self.assertEqual(derivation_address, derived_keypair.ss58_address)
-
-    def test_hdkd_nested_soft_hard_path(self):
-        """
-        Test hierarchical deterministic key derivation with a nested soft and hard derivation path.
-        """
-        derivation_address = "5Cwc8tShrshDJUp1P1M21dKUTcYQpV9GcfSa4hUBNmMdV3Cx"
-        derivation_path = "/Bob//test"
-        derived_keypair = Keypair.create_from_uri(derivation_path)
-        self.assertEqual(derivation_address, derived_keypair.ss58_address)
-
-    def test_hdkd_path_gt_32_bytes(self):
-        """
-        Test hierarchical deterministic key derivation with a derivation path longer than 32 bytes.
-        """
-        derivation_address = "5GR5pfZeNs1uQiSWVxZaQiZou3wdZiX894eqgvfNfHbEh7W2"
-        derivation_path = "//PathNameLongerThan32BytesWhichShouldBeHashed"
-        derived_keypair = Keypair.create_from_uri(derivation_path)
-        self.assertEqual(derivation_address, derived_keypair.ss58_address)
-
     def test_hdkd_unsupported_password(self):
         """
         Test hierarchical deterministic key derivation with an unsupported password.
@@ -314,7 +256,64 @@ class KeyPairTestCase(unittest.TestCase):
         )
 
 
+TEST_HDKD_MNEMONIC = (
+    "old leopard transfer rib spatial phone calm indicate online fire caution review"
+)
+
+
+@pytest.mark.parametrize(
+    "derivation_path,derivation_address",
+    [
+        # Hard derivation path.
+        (
+            TEST_HDKD_MNEMONIC + "//Alice",
+            "5FEiH8iuDUw271xbqWTWuB6WrDjv5dnCeDX1CyHubAniXDNN",
+        ),
+        # Soft derivation path.
+        (
+            TEST_HDKD_MNEMONIC + "/Alice",
+            "5GNXbA46ma5dg19GXdiKi5JH3mnkZ8Yea3bBtZAvj7t99P9i",
+        ),
+        # Default to the development mnemonic.
+        ("//Alice", "5GrwvaEF5zXb26Fz9rcQpDWS57CtERHpNehXCPcNoHGKutQY"),
+        # Nested hard and soft derivation path.
+        ("//Bob/test", "5CJGwWiKXSE16WJaxBdPZhWqUYkotgenLUALv7ZvqQ4TXeqf"),
+        # Nested soft and hard derivation path.
+        ("/Bob//test", "5Cwc8tShrshDJUp1P1M21dKUTcYQpV9GcfSa4hUBNmMdV3Cx"),
+        # Derivation path longer than 32 bytes, which should be hashed.
+        (
+            "//PathNameLongerThan32BytesWhichShouldBeHashed",
+            "5GR5pfZeNs1uQiSWVxZaQiZou3wdZiX894eqgvfNfHbEh7W2",
+        ),
+    ],
+)
+def test_hdkd_derivation_path(derivation_path, derivation_address):
+    """
+    Test hierarchical deterministic key derivation across derivation paths.
+    """
+    derived_keypair = Keypair.create_from_uri(derivation_path)
+    assert derivation_address == derived_keypair.ss58_address
+
+
 class TestKeyFiles(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Encrypting a keyfile runs the argon2i KDF at sensitive limits, so
+        # build the encrypted fixture once and copy it into each test's dir.
+        cls.template_path = f"/tmp/pytest{time.time()}template"
+        os.makedirs(cls.template_path, exist_ok=True)
+        template_keyfile = bittensor.keyfile(
+            path=os.path.join(cls.template_path, "keyfile")
+        )
+        bob = bittensor.Keypair.create_from_uri("/Bob")
+        template_keyfile.set_keypair(
+            bob, encrypt=True, overwrite=True, password="thisisafakepassword"
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls.template_path)
+
     def setUp(self) -> None:
         self.root_path = f"/tmp/pytest{time.time()}"
         os.makedirs(self.root_path, exist_ok=True)
@@ -325,20 +324,11 @@ class TestKeyFiles(unittest.TestCase):
         shutil.rmtree(self.root_path)
 
     def create_keyfile(self):
-        keyfile = bittensor.keyfile(path=os.path.join(self.root_path, "keyfile"))
-
-        mnemonic = bittensor.Keypair.generate_mnemonic(12)
-        alice = bittensor.Keypair.create_from_mnemonic(mnemonic)
-        keyfile.set_keypair(
-            alice, encrypt=True, overwrite=True, password="thisisafakepassword"
-        )
-
-        bob = bittensor.Keypair.create_from_uri("/Bob")
-        keyfile.set_keypair(
-            bob, encrypt=True, overwrite=True, password="thisisafakepassword"
+        shutil.copy(
+            os.path.join(self.template_path, "keyfile"),
+            os.path.join(self.root_path, "keyfile"),
         )
-
-        return keyfile
+        return bittensor.keyfile(path=os.path.join(self.root_path, "keyfile"))
 
     def test_create(self):
         keyfile = bittensor.keyfile(path=os.path.join(self.root_path, "keyfile"))
@@ -454,6 +444,35 @@ class TestKeyFiles(unittest.TestCase):
         decrypted_data = decrypt_keyfile_data(encrypted_data, pw)
         assert decrypted_data == data
 
+        # Exercise the optional rfernet fast path with a stub, since CI does
+        # not install the dependency. rfernet only accepts str tokens and
+        # raises its own DecryptionError on bad ciphertext.
+        class StubDecryptionError(Exception):
+            pass
+
+        class StubFernet:
+            def __init__(self, key):
+                assert isinstance(key, str)
+                self._fernet = Fernet(key.encode())
+
+            def decrypt(self, token):
+                if not isinstance(token, str):
+                    raise TypeError(
+                        "argument 'token': 'bytes' object cannot be converted to 'PyString'"
+                    )
+                try:
+                    return self._fernet.decrypt(token.encode())
+                except Exception:
+                    raise StubDecryptionError
+
+        stub_rfernet = types.SimpleNamespace(
+            Fernet=StubFernet, DecryptionError=StubDecryptionError
+        )
+        with mock.patch("bittensor.keyfile.rfernet", stub_rfernet):
+            assert decrypt_keyfile_data(encrypted_data, pw) == data
+            with pytest.raises(bittensor.KeyFileError):
+                decrypt_keyfile_data(encrypted_data, pw + "wrong")
+
     def test_user_interface(self):
         from bittensor.keyfile import ask_password_to_encrypt
 